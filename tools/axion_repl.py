@@ -4,45 +4,163 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import os
+import pickle
+import re
 try:
     import readline  # type: ignore
 except ImportError:  # pragma: no cover
     readline = None
 import sys
 import tempfile
+from collections import deque
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
 
 ROOT = Path(__file__).resolve().parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-try:
+if TYPE_CHECKING:  # pragma: no cover
     import axion_runner
-except ImportError as exc:  # pragma: no cover
-    raise SystemExit(f"Failed to import axion_runner: {exc}")
+
+_RUNNER = None
+
+
+def _runner():
+    # Imported on first use so --help and pure editing sessions never load the runner.
+    global _RUNNER
+    if _RUNNER is None:
+        try:
+            import axion_runner
+        except ImportError as exc:  # pragma: no cover
+            raise SystemExit(f"Failed to import axion_runner: {exc}")
+        _RUNNER = axion_runner
+    return _RUNNER
+
+
+_CMD_RE = re.compile(r"^:\s*(\S+)(?:\s+(.*))?$")
+
+DISK_CACHE = True
+# Entries kept under <cache root>/parsed; the least recently used go first.
+PARSE_CACHE_LIMIT = 256
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_cached(
+    buffer: tuple[str, ...]
+) -> tuple[axion_runner.ScenarioData, dict[str, tuple[int, int]] | None]:
+    # Keyed on the buffer contents, so any edit, :clear or :load misses naturally.
+    # Imported modules are not part of the key; their stamps are kept for _parse_buffer.
+    source = "\n".join(buffer) + "\n"
+    scenario = _load_or_parse(source)
+    return scenario, _runner()._file_stamps(scenario.imports)
+
+
+def _parse_buffer(buffer: tuple[str, ...]) -> axion_runner.ScenarioData:
+    scenario, stamps = _parse_cached(buffer)
+    if stamps is None or (stamps and _runner()._file_stamps(stamps) != stamps):
+        # An imported module changed on disk: both caches may hold stale results.
+        _parse_cached.cache_clear()
+        _format_cached.cache_clear()
+        scenario, stamps = _parse_cached(buffer)
+    return scenario
+
+
+def _load_or_parse(source: str) -> axion_runner.ScenarioData:
+    runner = _runner()
+    root = runner._cache_root() if DISK_CACHE else None
+    if root is None:
+        return runner.load_scenario_from_source(source)
+
+    cache_dir = root / "parsed"
+    # The runner's CACHE_VERSION covers ScenarioData layout changes for both caches.
+    key = hashlib.sha256(f"{runner.CACHE_VERSION}\0{source}".encode("utf-8")).hexdigest()
+    cache_path = cache_dir / f"{key}.pkl"
+    try:
+        with cache_path.open("rb") as handle:
+            scenario = pickle.load(handle)
+        os.utime(cache_path)
+        return scenario
+    except Exception:
+        pass
+
+    scenario = runner.load_scenario_from_source(source)
+    # Imported modules can change behind our back and invalidation is keyed on the
+    # buffer alone, so only self-contained scenarios are persisted.
+    if not scenario.imports:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with tmp_path.open("wb") as handle:
+                pickle.dump(scenario, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            _prune_parse_cache(cache_dir)
+        except OSError:
+            pass
+    return scenario
+
+
+def _prune_parse_cache(cache_dir: Path) -> None:
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".pkl"):
+                try:
+                    entries.append((entry.stat().st_mtime_ns, entry.path))
+                except OSError:
+                    pass
+    if len(entries) <= PARSE_CACHE_LIMIT:
+        return
+    entries.sort()
+    for _, path in entries[: len(entries) - PARSE_CACHE_LIMIT]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _precompile(buffer: deque[str]) -> None:
+    # Warm the parse cache ahead of the first :plan/:run; errors surface there instead.
+    try:
+        _parse_buffer(tuple(buffer))
+    except Exception:
+        pass
+
+
+@functools.lru_cache(maxsize=16)
+def _format_cached(
+    buffer: tuple[str, ...], overrides: tuple[tuple[str, str], ...]
+) -> str:
+    # Callers validate imports through _parse_buffer first.
+    return _runner().format_scenario(_parse_cached(buffer)[0], dict(overrides))
+
+
+def read_lines(path: Path) -> Iterator[str]:
+    # Stream the file so only the line list is held, never one giant string as well.
+    with path.open("r", encoding="utf-8", buffering=1 << 20) as handle:
+        for line in handle:
+            yield line.rstrip("\n")
 
 
-def write_temp(lines: list[str]) -> Path:
-    tmp = tempfile.NamedTemporaryFile("w", delete=False, suffix=".ax")
-    tmp.write("\n".join(lines) + "\n")
-    tmp.close()
-    return Path(tmp.name)
+def write_lines(path: Path, lines: Iterable[str]) -> None:
+    with path.open("wb", buffering=1 << 20) as handle:
+        handle.writelines(line.encode("utf-8") + b"\n" for line in lines)
+        if hasattr(os, "posix_fadvise") and _is_temp_path(path):
+            # Scratch saves are rarely re-read; let the kernel drop their pages early.
+            handle.flush()
+            os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _is_temp_path(path: Path) -> bool:
+    return path.resolve().is_relative_to(Path(tempfile.gettempdir()).resolve())
 
 
 def render_execution(summary, execution, artifacts) -> None:
-    print(axion_runner.format_summary(summary))
-    print("\nExecution:")
-    for step in execution:
-        print(f"  - {step['type']} {step['name']}: {step['status']} ({step['message']})")
-    failures = [step for step in execution if step["status"] == "failed"]
-    if failures:
-        print("\n[warn] some steps failed")
-    if artifacts:
-        print("\nArtifacts:")
-        for artifact in artifacts:
-            location = artifact.get("path") or "<memory>"
-            print(f"  - {artifact['name']} ({artifact['kind']}) -> {location}")
+    sys.stdout.write(_runner().format_execution(summary, execution, artifacts) + "\n")
+    sys.stdout.flush()
 
 
 def command_help() -> None:
@@ -55,122 +173,232 @@ def command_help() -> None:
   :set KEY VALUE      Override variable (repeat to adjust multiple values)
   :unset KEY          Remove override
   :vars               Show active overrides
+  :cachestats         Show parse/plan cache hits and misses
   :load PATH          Replace buffer with contents of PATH
   :save PATH          Write buffer to PATH
   :quit / :exit       Leave the console
 """)
 
 
-def axion_repl(initial: list[str] | None = None) -> None:
-    buffer: list[str] = initial[:] if initial else []
-    overrides: dict[str, str] = {}
+class _ExitREPL(Exception):
+    """Raised by :quit/:exit to leave the console loop."""
+
+
+def _cmd_help(buffer: deque[str], overrides: dict[str, str], rest: str) -> None:
+    command_help()
+
+
+def _cmd_quit(buffer: deque[str], overrides: dict[str, str], rest: str) -> None:
+    raise _ExitREPL
+
 
+def _cmd_show(buffer: deque[str], overrides: dict[str, str], rest: str) -> None:
+    if not buffer:
+        print("[empty]")
+        return
+    width = max(3, len(str(len(buffer))))
+    sys.stdout.write(
+        "".join(
+            f"{idx:0{width}}: {content}\n" for idx, content in enumerate(buffer, start=1)
+        )
+    )
+
+
+def _cmd_clear(buffer: deque[str], overrides: dict[str, str], rest: str) -> None:
+    buffer.clear()
+    print("[cleared]")
+
+
+def _cmd_plan(buffer: deque[str], overrides: dict[str, str], rest: str) -> None:
+    if not buffer:
+        print("[warn] buffer is empty")
+        return
+    try:
+        key = tuple(buffer)
+        _parse_buffer(key)
+        print(_format_cached(key, tuple(sorted(overrides.items()))))
+    except Exception as exc:
+        print(f"[error] {exc}")
+
+
+def _cmd_run(buffer: deque[str], overrides: dict[str, str], rest: str) -> None:
+    if not buffer:
+        print("[warn] buffer is empty")
+        return
+    try:
+        scenario = _parse_buffer(tuple(buffer))
+        summary, execution, artifacts = _runner().execute_scenario(
+            scenario, json_mode=False, overrides=overrides
+        )
+        render_execution(summary, execution, artifacts)
+    except Exception as exc:
+        print(f"[error] {exc}")
+
+
+def _cmd_set(buffer: deque[str], overrides: dict[str, str], rest: str) -> None:
+    parts = rest.split(None, 1)
+    if len(parts) < 2:
+        print("[error] usage: :set KEY VALUE")
+        return
+    key, value = parts
+    # Interned keys hash once and compare by identity in the override dict and cache keys.
+    key = sys.intern(key)
+    overrides[key] = value
+    print(f"[var] {key} = {value}")
+
+
+def _cmd_unset(buffer: deque[str], overrides: dict[str, str], rest: str) -> None:
+    parts = rest.split()
+    if len(parts) != 1:
+        print("[error] usage: :unset KEY")
+        return
+    key = parts[0]
+    removed = overrides.pop(key, None)
+    if removed is None:
+        print(f"[warn] override '{key}' not defined")
+    else:
+        print(f"[var] removed {key}")
+
+
+def _cmd_vars(buffer: deque[str], overrides: dict[str, str], rest: str) -> None:
+    if not overrides:
+        print("[var] (none)")
+        return
+    sys.stdout.write("".join(f"[var] {k} = {v}\n" for k, v in overrides.items()))
+
+
+def _cmd_cachestats(buffer: deque[str], overrides: dict[str, str], rest: str) -> None:
+    for label, cached in (("parse", _parse_cached), ("plan", _format_cached)):
+        info = cached.cache_info()
+        print(
+            f"[cache] {label}: hits={info.hits} misses={info.misses} "
+            f"size={info.currsize}/{info.maxsize}"
+        )
+
+
+def _cmd_load(buffer: deque[str], overrides: dict[str, str], rest: str) -> None:
+    if not rest:
+        print("[error] usage: :load PATH")
+        return
+    path = Path(rest).expanduser()
+    if not path.is_file():
+        print(f"[error] cannot read {path}")
+        return
+    buffer.clear()
+    buffer.extend(read_lines(path))
+    _precompile(buffer)
+    print(f"[load] {path} ({len(buffer)} lines)")
+
+
+def _cmd_save(buffer: deque[str], overrides: dict[str, str], rest: str) -> None:
+    if not rest:
+        print("[error] usage: :save PATH")
+        return
+    path = Path(rest).expanduser()
+    try:
+        write_lines(path, buffer)
+    except OSError as exc:
+        print(f"[error] cannot write {path}: {exc}")
+        return
+    print(f"[save] {path}")
+
+
+HANDLERS = {
+    "help": _cmd_help,
+    "quit": _cmd_quit,
+    "exit": _cmd_quit,
+    "show": _cmd_show,
+    "clear": _cmd_clear,
+    "plan": _cmd_plan,
+    "run": _cmd_run,
+    "set": _cmd_set,
+    "unset": _cmd_unset,
+    "vars": _cmd_vars,
+    "cachestats": _cmd_cachestats,
+    "load": _cmd_load,
+    "save": _cmd_save,
+}
+
+
+def _readlines(stream) -> Iterator[str]:
+    if not stream.isatty():
+        # Piped or non-TTY console: read the stream directly instead of an input()
+        # round-trip per line, but flush first as input() would so replies show up.
+        while True:
+            sys.stdout.flush()
+            line = stream.readline()
+            if not line:
+                return
+            yield line.rstrip("\n")
     while True:
         try:
-            line = input("axion> ")
+            yield input("axion> ")
         except EOFError:
             print()
-            break
+            return
         except KeyboardInterrupt:
             print()
-            continue
 
+
+def axion_repl(initial: list[str] | None = None) -> None:
+    buffer: deque[str] = deque(initial or ())
+    overrides: dict[str, str] = {}
+    if buffer:
+        _precompile(buffer)
+    if readline is not None:
+        # Only scenario lines are worth recalling; :commands would just bloat history.
+        readline.set_auto_history(False)
+        readline.set_history_length(1000)
+
+    for line in _readlines(sys.stdin):
         stripped = line.strip()
         if not stripped:
             continue
 
         if stripped.startswith(":"):
-            parts = stripped[1:].split()
-            if not parts:
+            match = _CMD_RE.match(stripped)
+            if match is None:
                 continue
-            cmd, *args = parts
-            if cmd in {"quit", "exit"}:
-                break
-            if cmd == "help":
-                command_help()
-            elif cmd == "show":
-                if not buffer:
-                    print("[empty]")
-                else:
-                    for idx, content in enumerate(buffer, start=1):
-                        print(f"{idx:03}: {content}")
-            elif cmd == "clear":
-                buffer.clear()
-                print("[cleared]")
-            elif cmd == "plan":
-                if not buffer:
-                    print("[warn] buffer is empty")
-                    continue
-                tmp = write_temp(buffer)
-                try:
-                    scenario = axion_runner.load_scenario(tmp)
-                    summary = axion_runner.build_summary(scenario, overrides)
-                    print(axion_runner.format_summary(summary))
-                except Exception as exc:
-                    print(f"[error] {exc}")
-                finally:
-                    tmp.unlink(missing_ok=True)
-            elif cmd == "run":
-                if not buffer:
-                    print("[warn] buffer is empty")
-                    continue
-                tmp = write_temp(buffer)
-                try:
-                    scenario = axion_runner.load_scenario(tmp)
-                    summary, execution, artifacts = axion_runner.execute_scenario(
-                        scenario, json_mode=False, overrides=overrides
-                    )
-                    render_execution(summary, execution, artifacts)
-                except Exception as exc:
-                    print(f"[error] {exc}")
-                finally:
-                    tmp.unlink(missing_ok=True)
-            elif cmd == "set" and len(args) >= 2:
-                key = args[0]
-                value = " ".join(args[1:])
-                overrides[key] = value
-                print(f"[var] {key} = {value}")
-            elif cmd == "unset" and len(args) == 1:
-                removed = overrides.pop(args[0], None)
-                if removed is None:
-                    print(f"[warn] override '{args[0]}' not defined")
-                else:
-                    print(f"[var] removed {args[0]}")
-            elif cmd == "vars":
-                if not overrides:
-                    print("[var] (none)")
-                else:
-                    for k, v in overrides.items():
-                        print(f"[var] {k} = {v}")
-            elif cmd == "load" and len(args) == 1:
-                path = Path(args[0]).expanduser()
-                if not path.is_file():
-                    print(f"[error] cannot read {path}")
-                else:
-                    buffer[:] = path.read_text().splitlines()
-                    print(f"[load] {path} ({len(buffer)} lines)")
-            elif cmd == "save" and len(args) == 1:
-                path = Path(args[0]).expanduser()
-                path.write_text("\n".join(buffer) + "\n")
-                print(f"[save] {path}")
-            else:
+            handler = HANDLERS.get(match.group(1))
+            if handler is None:
                 print(f"[error] unknown command: {stripped}")
+                continue
+            try:
+                handler(buffer, overrides, match.group(2) or "")
+            except _ExitREPL:
+                break
             continue
 
         buffer.append(line.rstrip("\n"))
+        if readline is not None:
+            readline.add_history(line)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Interactive Axion DSL console")
     parser.add_argument("path", nargs="?", help="Optional scenario to preload")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write parsed scenarios under ${XDG_CACHE_HOME:-~/.cache}/axion/parsed",
+    )
     args = parser.parse_args()
 
+    global DISK_CACHE
+    DISK_CACHE = not args.no_cache
+
+    if os.environ.get("AXION_WARMUP"):
+        # Pre-warm the bytecode used by this console's lazy import of the runner.
+        import compileall
+
+        compileall.compile_file(str(ROOT / "axion_runner.py"), quiet=1)
+
     initial: list[str] | None = None
     if args.path:
         scenario_path = Path(args.path)
         if not scenario_path.is_file():
             parser.error(f"cannot read {scenario_path}")
-        initial = scenario_path.read_text().splitlines()
+        initial = list(read_lines(scenario_path))
 
     print("Axion REPL. Type :help for commands.")
     axion_repl(initial)
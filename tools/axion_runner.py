@@ -10,23 +10,56 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
+import pickle
+import re
 import shlex
 import subprocess
 import sys
+import threading
 import time
+from contextlib import ExitStack
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Tuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
 
 
 ARTIFACTS_DIR = Path("artifacts")
+# Bump whenever parser output or the cached layout changes.
+CACHE_VERSION = 4
 DEBUG = bool(os.environ.get("AXION_DEBUG"))
+# Modules imported from many places resolve once instead of re-walking symlinks.
+_RESOLVED_IMPORTS: Dict[Tuple[Path, str], Path] = {}
+MAX_WORKERS = int(os.environ.get("AXION_MAX_WORKERS") or 0) or (os.cpu_count() or 1) * 4
+
+# Blank/comment lines match with no key; anything else must be "KEY VALUE", where a
+# value wrapped in matching quotes is captured without them.
+_KV_RE = re.compile(
+    r"\s*(?:(?://|#).*|(\S+)\s+(?:(['\"])(?:(.*)\2)?|(.*\S)))?\s*"
+)
+_LET_RE = re.compile(r"let\s+([^=]*?)\s*=(.*)")
+# A missing closing brace leaves group 2 unset so substitute() can report it.
+_VAR_RE = re.compile(r"\$\{([^}]*)(\})?")
+_SHELL_QUOTING_RE = re.compile(r"[\"'\\]")
+_SHELL_WS_RE = re.compile(r"[ \t\r\n]+")
+# \w is exactly str.isalnum() plus "_", so Unicode labels keep their letters.
+_UNSAFE_LABEL_RE = re.compile(r"[^\w.-]")
 
 
 @dataclass
 class Step:
+    # No per-instance __dict__: scenarios with thousands of steps stay compact.
+    __slots__ = ("type", "data")
+
     type: str
     data: Dict[str, object]
 
@@ -34,14 +67,13 @@ class Step:
 @dataclass
 class ScenarioData:
     steps: List[Step] = field(default_factory=list)
-    imports: List[str] = field(default_factory=list)
+    # Insertion-ordered set of resolved import paths.
+    imports: Dict[str, None] = field(default_factory=dict)
 
 
 def parse_value(raw: str) -> str:
     raw = raw.strip()
-    if not raw:
-        return ""
-    if raw[0] == raw[-1] and raw[0] in {'"', "'"}:
+    if raw and raw[0] in "\"'" and raw[-1] == raw[0]:
         return raw[1:-1]
     return raw
 
@@ -188,9 +220,93 @@ def parse_override_arg(raw: str) -> Tuple[str, object]:
     return key, parse_literal(value)
 
 
-def load_scenario(path: Path) -> ScenarioData:
+def load_scenario(path: Path, use_cache: bool = True) -> ScenarioData:
+    resolved = Path(path).resolve()
+    if use_cache:
+        cached = _load_cached(resolved)
+        if cached is not None:
+            return cached
+    visited: set[Path] = set()
+    scenario = _load_recursive(resolved, visited)
+    if use_cache:
+        _store_cached(resolved, scenario)
+    return scenario
+
+
+def _cache_root() -> Path | None:
+    # Resolved on use: without XDG_CACHE_HOME or a home directory (arbitrary-UID
+    # containers) there is simply no cache, rather than an import-time crash.
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        try:
+            base = Path.home() / ".cache"
+        except (KeyError, RuntimeError):
+            return None
+    return Path(base) / "axion"
+
+
+def _cache_path(path: Path) -> Path | None:
+    root = _cache_root()
+    if root is None:
+        return None
+    digest = hashlib.blake2b(str(path).encode("utf-8"), digest_size=16).hexdigest()
+    return root / "scenarios" / f"{digest}.pkl"
+
+
+def _file_stamps(paths) -> Dict[str, Tuple[int, int]] | None:
+    stamps: Dict[str, Tuple[int, int]] = {}
+    for item in paths:
+        try:
+            stat = os.stat(item)
+        except OSError:
+            return None
+        stamps[item] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+def _load_cached(path: Path) -> ScenarioData | None:
+    # Entries hold plain (type, data) tuples rather than Step objects, so they load the
+    # same whether this module runs as a script or is imported.
+    cache_path = _cache_path(path)
+    if cache_path is None:
+        return None
+    try:
+        with cache_path.open("rb") as handle:
+            version, stamps, steps, imports = pickle.load(handle)
+    except Exception:
+        return None
+    if version != CACHE_VERSION or _file_stamps(stamps) != stamps:
+        return None
+    return ScenarioData(steps=[Step(kind, data) for kind, data in steps], imports=imports)
+
+
+def _store_cached(path: Path, scenario: ScenarioData) -> None:
+    stamps = _file_stamps([str(path), *scenario.imports])
+    cache_path = _cache_path(path)
+    if stamps is None or cache_path is None:
+        return
+    steps = [(step.type, step.data) for step in scenario.steps]
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as handle:
+            pickle.dump(
+                (CACHE_VERSION, stamps, steps, scenario.imports),
+                handle,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def load_scenario_from_source(
+    text: str, name: str = "<repl>", base_dir: Path | None = None
+) -> ScenarioData:
+    # Parse in-memory scenario source; imports resolve against `base_dir` or the cwd.
     visited: set[Path] = set()
-    return _load_recursive(path.resolve(), visited)
+    root = (base_dir or Path.cwd()).resolve()
+    return _parse_lines(text.splitlines(), root, name, visited)
 
 
 def _load_recursive(path: Path, visited: set[Path]) -> ScenarioData:
@@ -198,8 +314,155 @@ def _load_recursive(path: Path, visited: set[Path]) -> ScenarioData:
         return ScenarioData()
     visited.add(path)
 
-    content = path.read_text(encoding="utf-8")
-    lines = content.splitlines()
+    content = _read_source(path)
+    return _parse_lines(content.splitlines(), path.parent, str(path), visited)
+
+
+def _read_source(path: Path) -> str:
+    # One open/fstat/read on the raw fd; no text-mode wrapper or newline translation
+    # pass (splitlines() handles every line ending anyway).
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = [os.read(fd, size)] if size else []
+        while True:
+            chunk = os.read(fd, 1 << 16)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode("utf-8")
+
+
+def _resolve_import(base_dir: Path, import_path: str) -> Path:
+    key = (base_dir, import_path)
+    resolved = _RESOLVED_IMPORTS.get(key)
+    if resolved is None:
+        resolved = _RESOLVED_IMPORTS[key] = (base_dir / import_path).resolve()
+    return resolved
+
+
+def _handle_import(
+    scenario: ScenarioData,
+    lines: List[str],
+    idx: int,
+    rest: str,
+    base_dir: Path,
+    visited: set[Path],
+) -> int:
+    import_path = parse_value(rest)
+    module_path = _resolve_import(base_dir, import_path)
+    module = _load_recursive(module_path, visited)
+    scenario.imports[str(module_path)] = None
+    scenario.imports.update(module.imports)
+    scenario.steps.extend(module.steps)
+    return idx + 1
+
+
+def _handle_let(
+    scenario: ScenarioData,
+    lines: List[str],
+    idx: int,
+    rest: str,
+    base_dir: Path,
+    visited: set[Path],
+) -> int:
+    name, value = _parse_let("let " + rest)
+    scenario.steps.append(Step("variable", {"name": name, "value": value}))
+    return idx + 1
+
+
+def _handle_group(
+    scenario: ScenarioData,
+    lines: List[str],
+    idx: int,
+    rest: str,
+    base_dir: Path,
+    visited: set[Path],
+) -> int:
+    props: Dict[str, object] = {}
+    remainder, next_idx = _collect_block(lines, idx, lambda raw: _kv_into(raw, props))
+    name = _parse_group_header(lines[idx])
+    scenario.steps.append(Step("group", {"name": name, "properties": props}))
+    return next_idx
+
+
+def _handle_scan(
+    scenario: ScenarioData,
+    lines: List[str],
+    idx: int,
+    rest: str,
+    base_dir: Path,
+    visited: set[Path],
+) -> int:
+    params: Dict[str, object] = {}
+    remainder, next_idx = _collect_block(lines, idx, lambda raw: _kv_into(raw, params))
+    scan_name, tool = _parse_scan_header(lines[idx])
+    output = _parse_output_label(remainder, default=f"scan_{scan_name}")
+    scenario.steps.append(
+        Step(
+            "scan",
+            {"name": scan_name, "tool": tool, "params": params, "output": output},
+        )
+    )
+    return next_idx
+
+
+def _handle_script(
+    scenario: ScenarioData,
+    lines: List[str],
+    idx: int,
+    rest: str,
+    base_dir: Path,
+    visited: set[Path],
+) -> int:
+    params: Dict[str, object] = {}
+    remainder, next_idx = _collect_block(lines, idx, lambda raw: _kv_into(raw, params))
+    script_name = _parse_script_header(lines[idx])
+    output = _parse_output_label(remainder, default=f"script_{script_name}")
+    scenario.steps.append(
+        Step(
+            "script",
+            {"name": script_name, "params": params, "output": output},
+        )
+    )
+    return next_idx
+
+
+def _handle_report(
+    scenario: ScenarioData,
+    lines: List[str],
+    idx: int,
+    rest: str,
+    base_dir: Path,
+    visited: set[Path],
+) -> int:
+    includes: List[str] = []
+    remainder, next_idx = _collect_block(
+        lines, idx, lambda raw: _inc_into(raw, includes)
+    )
+    report_name = _parse_report_header(lines[idx])
+    scenario.steps.append(Step("report", {"name": report_name, "includes": includes}))
+    if remainder.strip():
+        raise ValueError(f"Unexpected trailing contents in report block: {remainder}")
+    return next_idx
+
+
+# Directive keyword -> handler; each returns the index of the next unconsumed line.
+_HANDLERS = {
+    "import": _handle_import,
+    "let": _handle_let,
+    "group": _handle_group,
+    "scan": _handle_scan,
+    "script": _handle_script,
+    "report": _handle_report,
+}
+
+
+def _parse_lines(
+    lines: List[str], base_dir: Path, origin: str, visited: set[Path]
+) -> ScenarioData:
     idx = 0
     scenario = ScenarioData()
 
@@ -208,93 +471,28 @@ def _load_recursive(path: Path, visited: set[Path]) -> ScenarioData:
         stripped = raw_line.strip()
 
         if DEBUG:
-            print(f"[parse] {path}:{idx + 1}: {stripped!r}")
-
-        if not stripped or stripped.startswith("//"):
-            idx += 1
-            continue
+            print(f"[parse] {origin}:{idx + 1}: {stripped!r}")
 
-        if stripped.startswith("#"):
+        if not stripped or stripped.startswith(("//", "#")):
             idx += 1
             continue
 
-        if stripped.startswith("import "):
-            import_path = parse_value(stripped[len("import ") :])
-            module_path = (path.parent / import_path).resolve()
-            module = _load_recursive(module_path, visited)
-            scenario.imports.append(str(module_path))
-            scenario.imports.extend(module.imports)
-            scenario.steps.extend(module.steps)
-            idx += 1
-            continue
-
-        if stripped.startswith("let "):
-            name, value = _parse_let(stripped)
-            scenario.steps.append(Step("variable", {"name": name, "value": value}))
-            idx += 1
-            continue
-
-        if stripped.startswith("group "):
-            block, remainder, next_idx = _collect_block(lines, idx)
-            name = _parse_group_header(lines[idx])
-            props = _parse_key_values(block)
-            scenario.steps.append(
-                Step("group", {"name": name, "properties": props})
-            )
-            idx = next_idx
-            continue
-
-        if stripped.startswith("scan "):
-            block, remainder, next_idx = _collect_block(lines, idx)
-            scan_name, tool = _parse_scan_header(lines[idx])
-            params = _parse_key_values(block)
-            output = _parse_output_label(remainder, default=f"scan_{scan_name}")
-            scenario.steps.append(
-                Step(
-                    "scan",
-                    {"name": scan_name, "tool": tool, "params": params, "output": output},
-                )
-            )
-            idx = next_idx
-            continue
-
-        if stripped.startswith("script "):
-            block, remainder, next_idx = _collect_block(lines, idx)
-            script_name = _parse_script_header(lines[idx])
-            params = _parse_key_values(block)
-            output = _parse_output_label(remainder, default=f"script_{script_name}")
-            scenario.steps.append(
-                Step(
-                    "script",
-                    {"name": script_name, "params": params, "output": output},
-                )
-            )
-            idx = next_idx
-            continue
-
-        if stripped.startswith("report "):
-            block, remainder, next_idx = _collect_block(lines, idx)
-            report_name = _parse_report_header(lines[idx])
-            includes = _parse_report_includes(block)
-            scenario.steps.append(
-                Step("report", {"name": report_name, "includes": includes})
-            )
-            if remainder.strip():
-                raise ValueError(f"Unexpected trailing contents in report block: {remainder}")
-            idx = next_idx
-            continue
-
-        raise ValueError(f"Unsupported syntax in line: {raw_line}")
+        # Directives are "<keyword> <rest>"; a keyword without a following space
+        # is not a directive, matching the previous startswith("<keyword> ") checks.
+        keyword, space, rest = stripped.partition(" ")
+        handler = _HANDLERS.get(keyword) if space else None
+        if handler is None:
+            raise ValueError(f"Unsupported syntax in line: {raw_line}")
+        idx = handler(scenario, lines, idx, rest, base_dir, visited)
 
     return scenario
 
 
 def _parse_let(line: str) -> Tuple[str, object]:
-    rest = line[len("let ") :].strip()
-    if "=" not in rest:
+    match = _LET_RE.fullmatch(line)
+    if match is None:
         raise ValueError(f"Invalid let syntax: {line}")
-    name, value = rest.split("=", 1)
-    name = name.strip()
+    name, value = match.groups()
     if not name:
         raise ValueError(f"Invalid variable name in: {line}")
     return name, parse_literal(value)
@@ -346,42 +544,53 @@ def _parse_output_label(remainder: str, default: str) -> str:
     return label
 
 
-def _parse_key_values(block_lines: List[str]) -> Dict[str, object]:
-    result: Dict[str, object] = {}
-    for raw in block_lines:
-        stripped = raw.strip()
-        if not stripped or stripped.startswith("#") or stripped.startswith("//"):
-            continue
-        parts = stripped.split(None, 1)
-        if len(parts) != 2:
-            raise ValueError(f"Invalid key/value line: {raw}")
-        key = parts[0]
-        value = parse_value(parts[1])
-        result[key] = value
-    return result
+def _kv_into(raw: str, result: Dict[str, object]) -> None:
+    match = _KV_RE.fullmatch(raw)
+    if match is None:
+        raise ValueError(f"Invalid key/value line: {raw}")
+    key, quote, quoted, bare = match.groups()
+    if key is not None:
+        result[key] = (quoted or "") if quote else bare
 
 
-def _parse_report_includes(block_lines: List[str]) -> List[str]:
-    includes: List[str] = []
-    for raw in block_lines:
-        stripped = raw.strip()
-        if not stripped or stripped.startswith("#") or stripped.startswith("//"):
-            continue
-        if not stripped.startswith("include "):
-            raise ValueError(f"Unsupported directive in report: {raw}")
-        target = stripped[len("include ") :].strip()
-        includes.append(parse_value(target))
-    return includes
+def _inc_into(raw: str, includes: List[str]) -> None:
+    stripped = raw.strip()
+    if not stripped or stripped.startswith("#") or stripped.startswith("//"):
+        return
+    if not stripped.startswith("include "):
+        raise ValueError(f"Unsupported directive in report: {raw}")
+    target = stripped[len("include ") :].strip()
+    includes.append(parse_value(target))
 
 
-def _collect_block(lines: List[str], start_index: int) -> Tuple[List[str], str, int]:
+def _collect_block(
+    lines: List[str], start_index: int, on_line: Callable[[str], None]
+) -> Tuple[str, int]:
+    # Body errors are deferred until the block closes, so "not closed" still wins.
     header = lines[start_index]
     if "{" not in header:
         raise ValueError(f"Missing '{{' in block header: {header}")
     before, after = header.split("{", 1)
-    body: List[str] = []
+
+    # One-line block such as `group web { host "1.2.3.4" }`.
+    close = _find_closing_brace(after)
+    if close is not None:
+        if after[:close].strip():
+            on_line(after[:close])
+        return after[close + 1 :].strip(), start_index + 1
+
+    error: ValueError | None = None
+
+    def feed(body_line: str) -> None:
+        nonlocal error
+        if error is None:
+            try:
+                on_line(body_line)
+            except ValueError as exc:
+                error = exc
+
     if after.strip():
-        body.append(after)
+        feed(after)
 
     idx = start_index + 1
     remainder = ""
@@ -389,79 +598,113 @@ def _collect_block(lines: List[str], start_index: int) -> Tuple[List[str], str,
         current = lines[idx]
         closing_pos = _find_closing_brace(current)
         if closing_pos is None:
-            body.append(current)
+            feed(current)
             idx += 1
             continue
 
         before_close = current[:closing_pos]
         after_close = current[closing_pos + 1 :]
         if before_close.strip():
-            body.append(before_close)
+            feed(before_close)
+        if error is not None:
+            raise error
         remainder = after_close.strip()
         idx += 1
         if DEBUG:
-            print(
-                f"[collect] start={start_index} end={idx} remainder={remainder!r} body={body}"
-            )
+            print(f"[collect] start={start_index} end={idx} remainder={remainder!r}")
         break
     else:
         raise ValueError(f"Block not closed for header: {lines[start_index]}")
 
-    return body, remainder, idx
+    return remainder, idx
 
 
 def _find_closing_brace(line: str) -> int | None:
+    # Jump between braces with str.find, skipping over ${...} placeholders.
     idx = 0
-    length = len(line)
-    while idx < length:
-        char = line[idx]
-        if char == "$" and idx + 1 < length and line[idx + 1] == "{":
-            end = line.find("}", idx + 2)
-            if end == -1:
-                return None
-            idx = end + 1
-            continue
-        if char == "}":
-            return idx
-        idx += 1
-    return None
+    while True:
+        close = line.find("}", idx)
+        if close == -1:
+            return None
+        placeholder = line.find("${", idx, close)
+        if placeholder == -1:
+            return close
+        # The placeholder's own "}" is the first one after it, i.e. ``close``.
+        idx = close + 1
 
 
 def substitute(value: str, variables: Dict[str, object]) -> str:
-    result = []
-    idx = 0
-    while idx < len(value):
-        start = value.find("${", idx)
-        if start == -1:
-            result.append(value[idx:])
-            break
-        result.append(value[idx:start])
-        end = value.find("}", start + 2)
-        if end == -1:
+    if "${" not in value:
+        return value
+    return _expand(value, variables)
+
+
+def _expand(value: str, variables: Dict[str, object]) -> str:
+    def replace(match: re.Match) -> str:
+        if match.group(2) is None:
             raise ValueError(f"Unterminated variable placeholder in '{value}'")
-        name = value[start + 2 : end].strip()
+        name = match.group(1).strip()
         if not name:
             raise ValueError("Empty variable placeholder")
         if name not in variables:
             raise ValueError(f"Undefined variable '{name}' in '{value}'")
-        result.append(literal_to_string(variables[name]))
-        idx = end + 1
-    return "".join(result)
+        return literal_to_string(variables[name])
+
+    return _VAR_RE.sub(replace, value)
 
 
 def sanitize_label(label: str) -> str:
-    return "".join(c if c.isalnum() or c in "-_." else "_" for c in label)
+    return _UNSAFE_LABEL_RE.sub("_", label)
+
+
+def _orjson_safe(data: object) -> bool:
+    # orjson only differs from json.dumps on floats: 1e100 vs 1e+100, null for inf/NaN.
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif isinstance(item, float) and (
+            item != item or item in (float("inf"), float("-inf")) or "e" in repr(item)
+        ):
+            return False
+    return True
+
+
+def _dumps(data: object) -> bytes:
+    if orjson is not None and _orjson_safe(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson rejects e.g. integers beyond 64 bits; the stdlib encoder copes.
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+_ARTIFACTS_READY = False
 
 
 def ensure_artifacts_dir() -> None:
+    global _ARTIFACTS_READY
     ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
+    _ARTIFACTS_READY = True
+
+
+def _artifact_path(label: str) -> Path:
+    path = ARTIFACTS_DIR / f"{sanitize_label(label)}.json"
+    # ensure_artifacts_dir() already created the directory for this run.
+    if not (_ARTIFACTS_READY and path.parent == ARTIFACTS_DIR):
+        path.parent.mkdir(parents=True, exist_ok=True)
+    return path
 
 
 def build_summary(
     scenario: ScenarioData, overrides: Dict[str, object] | None = None
 ) -> Dict[str, object]:
     overrides = overrides or {}
-    imports = sorted(set(scenario.imports))
+    imports = sorted(scenario.imports)
     variables: List[Dict[str, object]] = []
     groups: List[Dict[str, object]] = []
     scans: List[Dict[str, object]] = []
@@ -557,6 +800,77 @@ def format_summary(summary: Dict[str, object]) -> str:
     return "\n".join(lines)
 
 
+_PLAN_SECTIONS = (
+    ("variable", "Variables:"),
+    ("group", "Asset groups:"),
+    ("scan", "Scans:"),
+    ("script", "Scripts:"),
+    ("report", "Reports:"),
+)
+
+
+def format_scenario(
+    scenario: ScenarioData, overrides: Dict[str, object] | None = None
+) -> str:
+    # Same text as `format_summary(build_summary(...))` in one pass over the steps.
+    sections: Dict[str, List[str]] = {kind: [] for kind, _ in _PLAN_SECTIONS}
+    for step in scenario.steps:
+        data = step.data
+        if step.type == "variable":
+            sections["variable"].append(
+                f"  - {data['name']} = {literal_to_string(data['value'])}"
+            )
+        elif step.type == "group":
+            props = ", ".join(f"{k}={v}" for k, v in data["properties"].items())
+            sections["group"].append(f"  - {data['name']} ({props})")
+        elif step.type == "scan":
+            output = data.get("output") or "<auto>"
+            sections["scan"].append(f"  - {data['name']} via {data['tool']} -> {output}")
+        elif step.type == "script":
+            output = data.get("output") or "<auto>"
+            sections["script"].append(f"  - {data['name']} -> {output}")
+        elif step.type == "report":
+            includes = ", ".join(data["includes"])
+            sections["report"].append(f"  - {data['name']} (includes: {includes})")
+
+    parts = [f"Steps: {len(scenario.steps)}"]
+    imports = sorted(scenario.imports)
+    if imports:
+        parts.append("Imports:")
+        parts.extend(f"  - {item}" for item in imports)
+    if overrides:
+        parts.append("Overrides:")
+        parts.extend(
+            f"  - {key} = {literal_to_string(value)}" for key, value in sorted(overrides.items())
+        )
+    for kind, heading in _PLAN_SECTIONS:
+        if sections[kind]:
+            parts.append(heading)
+            parts.extend(sections[kind])
+    return "\n".join(parts)
+
+
+def format_execution(
+    summary: Dict[str, object],
+    execution: List[Dict[str, object]],
+    artifacts: List[Dict[str, object]],
+) -> str:
+    parts = [format_summary(summary), "", "Execution:"]
+    parts.extend(
+        f"  - {step['type']} {step['name']}: {step['status']} ({step['message']})"
+        for step in execution
+    )
+    if any(step["status"] == "failed" for step in execution):
+        parts += ["", "[warn] some steps failed"]
+    if artifacts:
+        parts += ["", "Artifacts:"]
+        parts.extend(
+            f"  - {artifact['name']} ({artifact['kind']}) -> {artifact.get('path') or '<memory>'}"
+            for artifact in artifacts
+        )
+    return "\n".join(parts)
+
+
 def execute_scenario(
     scenario: ScenarioData,
     json_mode: bool,
@@ -569,8 +883,9 @@ def execute_scenario(
 
     artifacts: Dict[str, Dict[str, object]] = {}
     execution_steps: List[Dict[str, object]] = []
+    pending: Dict[int, Future] = {}
 
-    for step in scenario.steps:
+    for index, step in enumerate(scenario.steps):
         if step.type == "variable":
             name = step.data["name"]
             if name in override_raw:
@@ -611,7 +926,9 @@ def execute_scenario(
                     "message": message,
                 }
             )
-        elif step.type == "group":
+            continue
+
+        if step.type == "group":
             try:
                 props = {
                     key: substitute(value, variables)
@@ -643,12 +960,17 @@ def execute_scenario(
                         "message": str(exc),
                     }
                 )
-        elif step.type == "scan":
-            result = _execute_scan(step.data, variables)
-            artifacts[result["name"]] = result["artifact"]
-            execution_steps.append(result["execution"])
-        elif step.type == "script":
-            result = _execute_script(step.data, variables)
+        elif step.type in _PREPARE_STEPS:
+            if index not in pending:
+                pending = _run_wave(scenario.steps, index, variables)
+            try:
+                result = pending.pop(index).result()
+            except BaseException:
+                # Nothing after a failed step may start; let already running ones finish.
+                for future in pending.values():
+                    future.cancel()
+                wait(pending.values())
+                raise
             artifacts[result["name"]] = result["artifact"]
             execution_steps.append(result["execution"])
         elif step.type == "report":
@@ -670,18 +992,190 @@ def execute_scenario(
     return summary, execution_steps, artifacts_list
 
 
+def _run_wave(
+    steps: List[Step],
+    start: int,
+    variables: Dict[str, object],
+) -> Dict[int, Future]:
+    # Consecutive scans never assign variables, so they can execute side by side;
+    # results are consumed by step index to keep the original ordering. A script may
+    # read earlier tool output from artifacts/, so it always runs on its own.
+    launches: Dict[int, Callable[[], Dict[str, object]]] = {}
+    labels: set[str] = set()
+    for index in range(start, len(steps)):
+        step = steps[index]
+        if step.type not in _PREPARE_STEPS or (launches and step.type != "scan"):
+            break
+        label = sanitize_label(step.data.get("output") or f"{step.type}_{step.data['name']}")
+        if label in labels:
+            # Same artifact file: leave it to the next wave so writes stay ordered.
+            break
+        # Parameters and commands resolve here, before any process starts, so a bad
+        # placeholder aborts the run without launching the steps after it.
+        try:
+            launches[index] = _PREPARE_STEPS[step.type](step.data, variables)
+        except Exception:
+            if not launches:
+                raise
+            # Run the steps before it; the failing step is retried and raises next.
+            break
+        labels.add(label)
+        if step.type != "scan":
+            break
+
+    failed = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=min(len(launches), MAX_WORKERS))
+    try:
+        return {
+            index: executor.submit(_launch_unless_failed, launch, failed)
+            for index, launch in launches.items()
+        }
+    finally:
+        # Queued steps still run; the pool's threads exit once the wave drains.
+        executor.shutdown(wait=False)
+
+
+def _launch_unless_failed(
+    launch: Callable[[], Dict[str, object]], failed: threading.Event
+) -> Dict[str, object]:
+    # Skips steps that had not started when another one in the wave raised. Scans that
+    # were already running alongside it are not stopped, so with more than one worker
+    # a failed launch can still leave later scans of the wave executed.
+    if failed.is_set():
+        raise CancelledError
+    try:
+        return launch()
+    except BaseException:
+        failed.set()
+        raise
+
+
 def _write_artifact(label: str, data: Dict[str, object]) -> Path | None:
     try:
-        safe_label = sanitize_label(label)
-        path = ARTIFACTS_DIR / f"{safe_label}.json"
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        path = _artifact_path(label)
+        encoded = memoryview(_dumps(data))
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(path, flags, 0o666)
+        try:
+            while encoded:
+                encoded = encoded[os.write(fd, encoded) :]
+        finally:
+            os.close(fd)
+        return path
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _shell_split(value: str) -> Tuple[str, ...]:
+    # Without quotes or escapes shlex only splits on its own whitespace set.
+    if _SHELL_QUOTING_RE.search(value) is None:
+        return tuple(token for token in _SHELL_WS_RE.split(value) if token)
+    return tuple(shlex.split(value))
+
+
+def _write_report_streamed(
+    label: str, name: str, refs: Dict[str, Dict[str, object]]
+) -> Path | None:
+    # Splice {"$ref": path} includes in from disk, re-indented but never re-parsed.
+    try:
+        path = _artifact_path(label)
+        with path.open("wb") as dst:
+            dst.write(b'{\n  "name": ' + _dumps(name) + b',\n  "includes": {')
+            separator = b"\n    "
+            for include, entry in refs.items():
+                dst.write(separator + _dumps(include) + b": ")
+                ref = entry.get("$ref") if len(entry) == 1 else None
+                if ref is None:
+                    dst.write(_dumps(entry).replace(b"\n", b"\n    "))
+                else:
+                    with open(ref, "rb", buffering=1 << 20) as src:
+                        # Artifact JSON never has raw newlines inside strings, so
+                        # indenting each line keeps the splice byte-identical.
+                        dst.write(src.readline())
+                        for line in src:
+                            dst.write(b"    " + line)
+                separator = b",\n    "
+            dst.write(b"\n  }\n}" if refs else b"}\n}")
         return path
     except Exception:
         return None
 
 
-def _execute_scan(step_data: Dict[str, object], variables: Dict[str, object]) -> Dict[str, object]:
+def _run_command(command: List[str], cwd: str | None, label: str) -> Dict[str, object]:
+    # stdout/stderr go straight into <label>.stdout/.stderr next to the JSON artifact,
+    # so tool output is never buffered in memory or re-encoded into the manifest.
+    safe_label = sanitize_label(label)
+    stdout_path = ARTIFACTS_DIR / f"{safe_label}.stdout"
+    stderr_path = ARTIFACTS_DIR / f"{safe_label}.stderr"
+    started = time.time()
+    with ExitStack() as stack:
+        try:
+            out_file = stack.enter_context(stdout_path.open("wb"))
+            err_file = stack.enter_context(stderr_path.open("wb"))
+        except OSError:
+            # Artifacts directory unusable: keep the output in memory instead.
+            completed = subprocess.run(
+                command, cwd=cwd, capture_output=True, text=True, check=False
+            )
+            return {
+                "stdout": completed.stdout,
+                "stderr": completed.stderr,
+                "exit_code": completed.returncode,
+                "duration_ms": int((time.time() - started) * 1000),
+            }
+        try:
+            process = subprocess.Popen(command, cwd=cwd, stdout=out_file, stderr=err_file)
+        except OSError:
+            stack.close()
+            stdout_path.unlink(missing_ok=True)
+            stderr_path.unlink(missing_ok=True)
+            raise
+        returncode = process.wait()
+    return {
+        "stdout_path": str(stdout_path),
+        "stderr_path": str(stderr_path),
+        "exit_code": returncode,
+        "duration_ms": int((time.time() - started) * 1000),
+    }
+
+
+def _read_outputs(data: Dict[str, object]) -> Dict[str, object]:
+    # Copy of an artifact's data with the stdout/stderr side files read back inline.
+    if "stdout_path" not in data:
+        return data
+    expanded = dict(data)
+    for stream in ("stdout", "stderr"):
+        try:
+            expanded[stream] = Path(data[f"{stream}_path"]).read_text(
+                encoding="utf-8", errors="replace"
+            )
+        except OSError:
+            expanded[stream] = ""
+    return expanded
+
+
+def _materialize(data: object) -> object:
+    # Console rendering of an include: follow {"$ref": path} entries (e.g. inside an
+    # included report) and read output side files back inline.
+    if isinstance(data, dict):
+        if len(data) == 1 and "$ref" in data:
+            try:
+                data = json.loads(Path(data["$ref"]).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return data
+            return _materialize(data)
+        return {key: _materialize(value) for key, value in _read_outputs(data).items()}
+    if isinstance(data, list):
+        return [_materialize(item) for item in data]
+    return data
+
+
+def _prepare_scan(
+    step_data: Dict[str, object],
+    variables: Dict[str, object],
+) -> Callable[[], Dict[str, object]]:
+    # Resolve a scan's parameters and command; the returned callable runs it.
     params = {
         key: substitute(value, variables)
         for key, value in step_data["params"].items()
@@ -691,36 +1185,35 @@ def _execute_scan(step_data: Dict[str, object], variables: Dict[str, object]) ->
 
     command = [tool]
     if "flags" in params:
-        command.extend(shlex.split(params["flags"]))
+        command.extend(_shell_split(params["flags"]))
     if "args" in params:
-        command.extend(shlex.split(params["args"]))
+        command.extend(_shell_split(params["args"]))
     if params.get("target"):
         command.append(params["target"])
 
     cwd = params.get("cwd") or None
-    started = time.time()
+    return partial(_launch_scan, step_data, params, command, cwd, output_label)
 
+
+def _launch_scan(
+    step_data: Dict[str, object],
+    params: Dict[str, str],
+    command: List[str],
+    cwd: str | None,
+    output_label: str,
+) -> Dict[str, object]:
+    tool = step_data["tool"]
     try:
-        completed = subprocess.run(
-            command,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        duration_ms = int((time.time() - started) * 1000)
+        outcome = _run_command(command, cwd, output_label)
         artifact_data = {
             "tool": tool,
             "params": params,
             "invocation": command,
-            "stdout": completed.stdout,
-            "stderr": completed.stderr,
-            "exit_code": completed.returncode,
-            "duration_ms": duration_ms,
+            **outcome,
         }
         path = _write_artifact(output_label, artifact_data)
-        status = "completed" if completed.returncode == 0 else "failed"
-        message = f"{tool} exit {completed.returncode}, artifact: {path or '<memory>'}"
+        status = "completed" if outcome["exit_code"] == 0 else "failed"
+        message = f"{tool} exit {outcome['exit_code']}, artifact: {path or '<memory>'}"
     except FileNotFoundError:
         status = "failed"
         artifact_data = {
@@ -752,7 +1245,11 @@ def _execute_scan(step_data: Dict[str, object], variables: Dict[str, object]) ->
     }
 
 
-def _execute_script(step_data: Dict[str, object], variables: Dict[str, object]) -> Dict[str, object]:
+def _prepare_script(
+    step_data: Dict[str, object],
+    variables: Dict[str, object],
+) -> Callable[[], Dict[str, object]]:
+    # Resolve a script's parameters and command; the returned callable runs it.
     params = {
         key: substitute(value, variables)
         for key, value in step_data["params"].items()
@@ -761,7 +1258,7 @@ def _execute_script(step_data: Dict[str, object], variables: Dict[str, object])
 
     run_value = params.get("run")
     if not run_value:
-        return {
+        result = {
             "name": output_label,
             "artifact": {
                 "name": output_label,
@@ -776,32 +1273,27 @@ def _execute_script(step_data: Dict[str, object], variables: Dict[str, object])
                 "message": "missing required parameter: run",
             },
         }
+        return lambda: result
 
-    command = shlex.split(run_value)
+    command = list(_shell_split(run_value))
     if "args" in params:
-        command.extend(shlex.split(params["args"]))
+        command.extend(_shell_split(params["args"]))
     cwd = params.get("cwd") or None
+    return partial(_launch_script, step_data, command, cwd, output_label)
 
-    started = time.time()
+
+def _launch_script(
+    step_data: Dict[str, object],
+    command: List[str],
+    cwd: str | None,
+    output_label: str,
+) -> Dict[str, object]:
     try:
-        completed = subprocess.run(
-            command,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        duration_ms = int((time.time() - started) * 1000)
-        artifact_data = {
-            "command": command,
-            "stdout": completed.stdout,
-            "stderr": completed.stderr,
-            "exit_code": completed.returncode,
-            "duration_ms": duration_ms,
-        }
+        outcome = _run_command(command, cwd, output_label)
+        artifact_data = {"command": command, **outcome}
         path = _write_artifact(output_label, artifact_data)
-        status = "completed" if completed.returncode == 0 else "failed"
-        message = f"exit {completed.returncode}, artifact: {path or '<memory>'}"
+        status = "completed" if outcome["exit_code"] == 0 else "failed"
+        message = f"exit {outcome['exit_code']}, artifact: {path or '<memory>'}"
     except FileNotFoundError:
         artifact_data = {
             "command": command,
@@ -843,18 +1335,28 @@ def _execute_report(
     for name in includes:
         if name not in artifacts:
             raise ValueError(f"Missing artifact '{name}' for report '{step_data['name']}'")
-        included_data[name] = artifacts[name]["data"]
+        artifact_path = artifacts[name]["path"]
+        included_data[name] = (
+            {"$ref": artifact_path} if artifact_path else artifacts[name]["data"]
+        )
 
     report_data = {
         "name": step_data["name"],
         "includes": included_data,
     }
     label = f"report:{step_data['name']}"
-    path = _write_artifact(label, report_data)
+    path = _write_report_streamed(label, step_data["name"], included_data)
 
     if step_data["name"] == "stdout":
-        rendered = json.dumps(report_data, indent=2, ensure_ascii=False)
-        print(rendered)
+        rendered = _dumps(
+            {
+                "name": report_data["name"],
+                "includes": {
+                    name: _materialize(artifacts[name]["data"]) for name in included_data
+                },
+            }
+        )
+        print(rendered.decode("utf-8"))
 
     execution = {
         "name": step_data["name"],
@@ -875,21 +1377,24 @@ def _execute_report(
     }
 
 
+_PREPARE_STEPS = {"scan": _prepare_scan, "script": _prepare_script}
+
+
 def plan_command(args: argparse.Namespace) -> None:
     overrides_list = [parse_override_arg(item) for item in args.var or []]
     override_map = dict(overrides_list)
-    scenario = load_scenario(Path(args.input))
-    summary = build_summary(scenario, override_map)
+    scenario = load_scenario(Path(args.input), use_cache=not args.no_cache)
     if args.json:
-        print(json.dumps(summary, indent=2, ensure_ascii=False))
+        summary = build_summary(scenario, override_map)
+        print(_dumps(summary).decode("utf-8"))
     else:
-        print(format_summary(summary))
+        print(format_scenario(scenario, override_map))
 
 
 def run_command(args: argparse.Namespace) -> None:
     overrides_list = [parse_override_arg(item) for item in args.var or []]
     override_map = dict(overrides_list)
-    scenario = load_scenario(Path(args.input))
+    scenario = load_scenario(Path(args.input), use_cache=not args.no_cache)
     summary, execution, artifacts = execute_scenario(scenario, args.json, override_map)
     if args.json:
         payload = {
@@ -897,23 +1402,11 @@ def run_command(args: argparse.Namespace) -> None:
             "execution": execution,
             "artifacts": artifacts,
         }
-        print(json.dumps(payload, indent=2, ensure_ascii=False))
+        print(_dumps(payload).decode("utf-8"))
         return
 
-    print(format_summary(summary))
-    print("\nExecution:")
-    for step in execution:
-        status = step["status"]
-        print(f"  - {step['type']} {step['name']}: {status} ({step['message']})")
-    failures = [step for step in execution if step["status"] == "failed"]
-    if failures:
-        print("\n[warn] some steps failed")
-    if artifacts:
-        print("\nArtifacts:")
-        for artifact in artifacts:
-            location = artifact.get("path") or "<memory>"
-            print(f"  - {artifact['name']} ({artifact['kind']}) -> {location}")
-
+    sys.stdout.write(format_execution(summary, execution, artifacts) + "\n")
+    sys.stdout.flush()
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -930,6 +1423,11 @@ def build_arg_parser() -> argparse.ArgumentParser:
         metavar="KEY=VALUE",
         help="Override a variable (repeatable)",
     )
+    plan.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse from scratch without reading or writing the scenario cache",
+    )
     plan.set_defaults(func=plan_command)
 
     run = subparsers.add_parser("run", help="Execute a scenario")
@@ -942,11 +1440,37 @@ def build_arg_parser() -> argparse.ArgumentParser:
         metavar="KEY=VALUE",
         help="Override a variable (repeatable)",
     )
+    run.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse from scratch without reading or writing the scenario cache",
+    )
     run.set_defaults(func=run_command)
 
     return parser
 
 
+_FAST_COMMANDS = {"plan": plan_command, "run": run_command}
+_FAST_FLAGS = {"--json", "--no-cache"}
+
+
+def _fast_parse(argv: List[str]) -> argparse.Namespace | None:
+    # Namespace for `plan|run <file> [--json] [--no-cache]` without building the parser.
+    if len(argv) < 2 or argv[0] not in _FAST_COMMANDS or argv[1].startswith("-"):
+        return None
+    flags = argv[2:]
+    if not _FAST_FLAGS.issuperset(flags):
+        return None
+    return argparse.Namespace(
+        command=argv[0],
+        input=argv[1],
+        json="--json" in flags,
+        var=[],
+        no_cache="--no-cache" in flags,
+        func=_FAST_COMMANDS[argv[0]],
+    )
+
+
 def main(argv: List[str] | None = None) -> None:
     if argv is None:
         argv = sys.argv[1:]
@@ -956,8 +1480,8 @@ def main(argv: List[str] | None = None) -> None:
         if possible.suffix == ".ax" and possible.exists():
             argv = ["run"] + argv
 
-    parser = build_arg_parser()
-    args = parser.parse_args(argv)
+    # Anything beyond the common shape (help, --var, odd ordering) goes through argparse.
+    args = _fast_parse(argv) or build_arg_parser().parse_args(argv)
     try:
         args.func(args)
     except Exception as exc:  # pragma: no cover - user-facing